@@ -1,161 +1,948 @@
 import os
 import sys
+import errno
+import stat
 import shutil
+import signal
 import threading
 import time
 import psutil
 import hashlib
+import json
+import itertools
+import mmap
+import queue
 import argparse
+import subprocess
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from colorama import Fore, Style, init
 
+try:
+    import blake3 # Optional: SIMD-accelerated hashing, much faster than hashlib on large files
+except ImportError:
+    blake3 = None
+
+try:
+    import fcntl # POSIX only; used for reflink copies on Linux
+except ImportError:
+    fcntl = None
+
+# On POSIX terminals ANSI codes need no translation, so the progress UI bypasses Colorama's stdout wrapper
+_raw_stdout = sys.stdout
+
 # Initialize Colorama for cross-platform colored text
 init(autoreset=True)
 
-# --- Global state for communication between threads ---
-copy_error = None
-currently_processed_file = "Initializing..."
-status_message = "" # New global for status updates
+# --- Stats line templates: colors are folded in once, leaving only the values to format per tick ---
+STATS_TEMPLATE = (f"{Fore.CYAN}CPU: {{:>5.1f}}%{Style.RESET_ALL} | "
+                  f"{Fore.MAGENTA}RAM: {{:>5.1f}}%{Style.RESET_ALL} | "
+                  f"{Fore.GREEN}Up: {{}}{Style.RESET_ALL} | "
+                  f"{Fore.YELLOW}Down: {{}}{Style.RESET_ALL} | "
+                  f"{Style.DIM}File: {{:<30.30}}{Style.RESET_ALL}")
+STATS_TEMPLATE_NO_NET = (f"{Fore.CYAN}CPU: {{:>5.1f}}%{Style.RESET_ALL} | "
+                         f"{Fore.MAGENTA}RAM: {{:>5.1f}}%{Style.RESET_ALL} | "
+                         f"{Style.DIM}File: {{:<30.30}}{Style.RESET_ALL}")
+
+DEFAULT_JOBS = min(8, (os.cpu_count() or 1) * 2)
+UI_REFRESH_INTERVAL = 0.25 # Seconds between monitor ticks
+STATS_SAMPLE_INTERVAL = 2.0 # Seconds between psutil samples
+REDRAW_PROGRESS_STEP = 0.01 # Fraction of the total that must be copied before a tick redraws the bar
+
+# --- Digest algorithm used for verification (SHA-1 uses SHA-NI via OpenSSL on modern CPUs) ---
+DEFAULT_DIGEST = "blake3" if blake3 is not None else "sha1"
+
+# --- Persistent checksum cache: sha256(path) -> [size, mtime_ns, algorithm, digest] ---
+CHECKSUM_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "smartcopy", "checksums.json")
+checksum_cache = {}
+_checksum_cache_dirty = False # Set when a digest is stored, so runs that only read the cache don't rewrite it
+# Entries are kept oldest first; past this many the oldest are dropped, so digests of files that were
+# deleted or renamed don't pile up forever
+CHECKSUM_CACHE_LIMIT = 200_000
+
+# --- Per-thread 4 MiB read buffer, reused across every file a thread hashes, copies or compares ---
+READ_BUFFER_SIZE = 4 << 20
+_thread_buffers = threading.local()
+# Files larger than this are hashed straight from a memory map instead of through the read buffer
+MMAP_DIGEST_THRESHOLD = 32 << 20
+# On multi-core machines, large files are hashed on a helper thread while the copying thread writes,
+# through this many rotating buffers
+PIPELINED_HASH_SIZE = 64 << 20
+PIPELINE_DEPTH = 4
+PIPELINE_HASHING = (os.cpu_count() or 1) > 1
+# Content comparisons of multi-chunk files check this many trailing bytes before reading from the start
+TAIL_CHECK_SIZE = 64 << 10
+
+# --- Kernel-side copy tuning: the copy strategy is picked by file size ---
+SMALL_FILE_SIZE = 128 << 10 # Below this a plain read/write beats setting up any kernel-side copy
+LARGE_FILE_SIZE = 64 << 20 # From this size up, copy_file_range is used ahead of sendfile
+COPY_FILE_RANGE_CHUNK_SIZE = 16 << 20
+SENDFILE_CHUNK_SIZE = 2 << 20
+# errno values meaning "this kernel copy method is unavailable here", so the next method should be tried
+_KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK}
+
+# --- Copy-on-write clones: FICLONE ioctl on Linux (btrfs, XFS), clonefile(2) on macOS (APFS) ---
+FICLONE = 0x40049409
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        import ctypes
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        _clonefile = None
+# (source st_dev, destination st_dev) pairs where cloning failed, so it isn't attempted again
+_no_reflink_devices = set()
+
+# --- Preallocation: fallocate(2) on Linux; glibc's posix_fallocate falls back to writing every block
+# on filesystems without native support (NFSv3, most FUSE), while fallocate just fails with EOPNOTSUPP ---
+_fallocate = None
+if sys.platform.startswith("linux"):
+    try:
+        import ctypes
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _fallocate = getattr(_libc, "fallocate64", None) or _libc.fallocate # 64-bit offsets on 32-bit builds too
+        _fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    except (OSError, AttributeError):
+        _fallocate = None
+
+# Destination directories known to exist, so copying each file doesn't call os.makedirs again
+_created_dirs = set()
+
+# Robocopy file classes that mean the file was copied; "*EXTRA File" and friends describe files it left alone
+ROBOCOPY_COPIED_CLASSES = {"new file", "newer", "older", "changed"}
+
+@dataclass
+class ProgressState:
+    """
+    A progress report from a copy thread to the monitor, sent through a queue.SimpleQueue.
+    Fields left as None are unchanged; `bytes_done` counts bytes finished since the last report, and
+    `bytes_found` and `files_found` the bytes and files discovered by a scan that runs alongside the copy.
+    The monitor folds reports into its own ProgressState, where the counts are running totals.
+    """
+    current_file: str | None = None
+    bytes_done: int = 0
+    bytes_found: int = 0
+    files_found: int = 0
+    error: tuple | None = None
+    status: str | None = None
+
+class FileEntry(NamedTuple):
+    """A source file found by scan_tree, with its destination path and stat results."""
+    src: str
+    dst: str
+    size: int
+    mtime_ns: int
+
+class CopyCancelled(Exception):
+    """Raised inside a copy loop when the user cancels, abandoning the file being copied."""
+
+def _check_cancelled(cancel_evt: threading.Event | None):
+    """Called once per chunk by the copy loops, so a cancelled copy stops within one chunk."""
+    if cancel_evt is not None and cancel_evt.is_set():
+        raise CopyCancelled()
 
 def clear_screen():
     """Clears the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
-def get_checksum(file_path: str) -> str | None:
-    """Calculates the MD5 checksum of a file, returning None if the file is inaccessible."""
-    hash_md5 = hashlib.md5()
-    buffer_size = 65536
+def _get_read_buffer() -> tuple[bytearray, memoryview]:
+    """Returns this thread's reusable read buffer, allocating it on first use."""
+    if not hasattr(_thread_buffers, "buf"):
+        _thread_buffers.buf = bytearray(READ_BUFFER_SIZE)
+        _thread_buffers.view = memoryview(_thread_buffers.buf)
+    return _thread_buffers.buf, _thread_buffers.view
+
+def _get_compare_buffer() -> bytearray:
+    """Returns this thread's second buffer, used to read destinations alongside the read buffer."""
+    if not hasattr(_thread_buffers, "compare_buf"):
+        _thread_buffers.compare_buf = bytearray(READ_BUFFER_SIZE)
+    return _thread_buffers.compare_buf
+
+@contextmanager
+def _open_sequential(file_path: str):
+    """
+    Opens a file for unbuffered reading and tells the kernel it will be read front to back,
+    so it reads ahead aggressively. On close its cached pages are dropped, so scanning a large
+    tree doesn't evict the rest of the page cache. The hints are skipped where unsupported.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+        try:
+            yield f
+        finally:
+            _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+def _fadvise(fd: int, advice: str):
+    """
+    Applies a posix_fadvise hint to a whole file, ignoring platforms and files that don't support it.
+    On a freshly written file, Linux's DONTNEED also starts writeback, so dirty pages don't pile up.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+def _new_hasher(algo: str, multithreaded: bool = False):
+    """
+    Creates a hash object for the given algorithm name. With `multithreaded`, BLAKE3 splits
+    large inputs across all cores using its internal tree structure (other algorithms ignore it).
+    """
+    if algo == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO) if multithreaded else blake3.blake3()
+    return hashlib.new(algo)
+
+def _update_from_mmap(f, hasher) -> bool:
+    """
+    Hashes a whole file in one update() over a read-only memory map, so no data is copied into
+    Python buffers and the hash runs without the GIL. Returns False if the file can't be mapped.
+    """
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(buffer_size), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mm)
+        return True
+    except (OSError, ValueError):
+        return False
+
+def get_digest(file_path: str, algo: str = DEFAULT_DIGEST) -> str | None:
+    """Calculates the hex digest of a file, returning None if the file is inaccessible."""
+    buf, view = _get_read_buffer()
+    try:
+        with _open_sequential(file_path) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_DIGEST_THRESHOLD:
+                hasher = _new_hasher(algo, multithreaded=True)
+                if _update_from_mmap(f, hasher):
+                    return hasher.hexdigest()
+            hasher = _new_hasher(algo)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+        return hasher.hexdigest()
     except (IOError, OSError):
         return None
 
-def get_total_size(path: str) -> int:
-    """Recursively calculates the total size of a file or a directory."""
-    if os.path.isfile(path): return os.path.getsize(path)
-    total_size = 0
+def load_checksum_cache():
+    """Loads the persisted checksum cache from disk, starting empty if it is missing or unreadable."""
+    global checksum_cache, _checksum_cache_dirty
+    _checksum_cache_dirty = False
     try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                if os.path.exists(fp) and not os.path.islink(fp):
-                    total_size += os.path.getsize(fp)
-    except OSError as e:
-        tqdm.write(f"{Fore.RED}Error calculating size for {path}: {e}")
-    return total_size
-
-def _copy_file_with_retry(src_file: str, dest_file: str, retries: int):
-    """Helper function to handle the copy and retry logic for a single file."""
-    global copy_error, currently_processed_file, status_message
-    
+        with open(CHECKSUM_CACHE_PATH, "r", encoding="utf-8") as f:
+            checksum_cache = json.load(f)
+    except (OSError, ValueError):
+        checksum_cache = {}
+
+def save_checksum_cache():
+    """
+    Writes the checksum cache back to disk if digests were stored since it was loaded, first dropping
+    the oldest entries beyond CHECKSUM_CACHE_LIMIT. Failures are ignored (the cache is only an optimization).
+    """
+    global _checksum_cache_dirty
+    if not _checksum_cache_dirty:
+        return
+    for key in list(itertools.islice(checksum_cache, max(0, len(checksum_cache) - CHECKSUM_CACHE_LIMIT))):
+        del checksum_cache[key]
+    _checksum_cache_dirty = False
+    try:
+        os.makedirs(os.path.dirname(CHECKSUM_CACHE_PATH), exist_ok=True)
+        tmp_path = CHECKSUM_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checksum_cache, f)
+        os.replace(tmp_path, CHECKSUM_CACHE_PATH)
+    except OSError:
+        pass
+
+def _cache_key(path: str) -> str:
+    """Returns the cache key for a file path."""
+    return hashlib.sha256(os.path.abspath(path).encode("utf-8", "surrogateescape")).hexdigest()
+
+def get_cached_digest(path: str, size: int, mtime_ns: int, algo: str = DEFAULT_DIGEST) -> str | None:
+    """Returns the cached digest of a file if it used `algo` and the size and mtime are unchanged."""
+    cached = checksum_cache.get(_cache_key(path))
+    if cached and len(cached) == 4 and cached[:3] == [size, mtime_ns, algo]:
+        return cached[3]
+    return None
+
+def store_digest(path: str, digest: str, algo: str = DEFAULT_DIGEST):
+    """Records the digest of a file, and the algorithm used, against its current size and mtime."""
+    global _checksum_cache_dirty
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    key = _cache_key(path)
+    checksum_cache.pop(key, None) # Re-inserted at the end, so it counts as the newest entry
+    checksum_cache[key] = [st.st_size, st.st_mtime_ns, algo, digest]
+    _checksum_cache_dirty = True
+
+def _files_equal(entry: FileEntry, quick_check: bool = True) -> bool:
+    """
+    Checks whether the destination already holds the same content as the source.
+    Sizes are compared first, then (with `quick_check`) whole-second modification times and cached
+    digests, and only then the bytes themselves. Cached digests are keyed on size and mtime, so without
+    `quick_check` they aren't trusted either and the bytes are always compared. The source's size and
+    mtime come from the scan, so only the destination is stat'ed here. When the bytes match but the
+    timestamps don't, the source's are copied over, so the next run settles the file on the quick check.
+    """
+    try:
+        dest_stat = os.stat(entry.dst)
+    except OSError:
+        return False
+    if entry.size != dest_stat.st_size:
+        return False
+    if quick_check and entry.mtime_ns // 1_000_000_000 == dest_stat.st_mtime_ns // 1_000_000_000:
+        return True
+
+    if quick_check:
+        src_digest = get_cached_digest(entry.src, entry.size, entry.mtime_ns)
+        dest_digest = get_cached_digest(entry.dst, dest_stat.st_size, dest_stat.st_mtime_ns)
+        if src_digest and dest_digest:
+            return src_digest == dest_digest
+
+    if not _content_equal(entry.src, entry.dst, entry.size):
+        return False
+    if entry.mtime_ns // 1_000_000_000 != dest_stat.st_mtime_ns // 1_000_000_000:
+        try:
+            shutil.copystat(entry.src, entry.dst)
+        except OSError:
+            pass
+    return True
+
+def _content_equal(src_file: str, dest_file: str, size: int) -> bool:
+    """
+    Compares two files of `size` bytes chunk by chunk, returning False at the first difference,
+    so a partial copy is usually rejected after reading a single chunk. Multi-chunk files have
+    their tails compared first, catching copies cut short after the destination was preallocated.
+    """
+    if size == 0:
+        return True
+    src_buf, _ = _get_read_buffer()
+    dest_buf = _get_compare_buffer()
+    try:
+        with _open_sequential(src_file) as f_src, _open_sequential(dest_file) as f_dest:
+            if size > READ_BUFFER_SIZE:
+                tail_offset = size - TAIL_CHECK_SIZE
+                if _read_at(f_src, TAIL_CHECK_SIZE, tail_offset) != _read_at(f_dest, TAIL_CHECK_SIZE, tail_offset):
+                    return False
+            while True:
+                n = f_src.readinto(src_buf)
+                m = f_dest.readinto(dest_buf)
+                if n != m:
+                    return False
+                if not n:
+                    return True
+                # Whole-buffer comparison is a single memcmp; only the final short chunk needs slicing
+                if n == len(src_buf):
+                    if src_buf != dest_buf:
+                        return False
+                elif src_buf[:n] != dest_buf[:n]:
+                    return False
+    except (IOError, OSError):
+        return False
+
+def _read_at(f, length: int, offset: int) -> bytes:
+    """Reads up to `length` bytes at `offset`, leaving the file position where it was."""
+    if hasattr(os, "pread"):
+        return os.pread(f.fileno(), length, offset)
+    position = f.tell()
+    try:
+        f.seek(offset)
+        return f.read(length)
+    finally:
+        f.seek(position)
+
+def _read_back(f, buf: memoryview, offset: int) -> int:
+    """Reads into `buf` from `offset` of a readable file, leaving the file position where it was."""
+    if hasattr(os, "preadv"):
+        return os.preadv(f.fileno(), [buf], offset)
+    position = f.tell()
+    try:
+        f.seek(offset)
+        return f.readinto(buf)
+    finally:
+        f.seek(position)
+
+def _record_copied_file(src_file: str, dest_file: str, digest: str):
+    """Caches the digest of a freshly copied file for both the source and the destination."""
+    store_digest(src_file, digest)
+    store_digest(dest_file, digest)
+
+def _write_all(f, data: memoryview):
+    """Writes all of `data` to an unbuffered file, continuing after short writes."""
+    while data:
+        data = data[f.write(data):]
+
+def _copy_with_copy_file_range(fd_in: int, fd_out: int, remaining: int, cancel_evt: threading.Event | None = None):
+    """Copies up to `remaining` bytes in the kernel via copy_file_range, stopping quietly if unsupported."""
+    while remaining > 0:
+        _check_cancelled(cancel_evt)
+        try:
+            n = os.copy_file_range(fd_in, fd_out, min(remaining, COPY_FILE_RANGE_CHUNK_SIZE))
+        except OSError as e:
+            if e.errno in _KERNEL_COPY_UNSUPPORTED:
+                return
+            raise
+        if n == 0:
+            break
+        remaining -= n
+
+def _copy_with_sendfile(fd_in: int, fd_out: int, remaining: int, cancel_evt: threading.Event | None = None):
+    """Copies up to `remaining` bytes in the kernel via sendfile, stopping quietly if unsupported."""
+    while remaining > 0:
+        _check_cancelled(cancel_evt)
+        try:
+            n = os.sendfile(fd_out, fd_in, None, min(remaining, SENDFILE_CHUNK_SIZE))
+        except OSError as e:
+            if e.errno in _KERNEL_COPY_UNSUPPORTED:
+                return
+            raise
+        if n == 0:
+            break
+        remaining -= n
+
+def _copy_loop(f_src, f_dest, hasher=None, dest_hasher=None, cancel_evt=None):
+    """
+    Copies the rest of `f_src` to `f_dest` through the thread's read buffer, optionally hashing each chunk.
+    With `f_dest` set to None the data is only hashed. With `dest_hasher`, each chunk is read back from
+    the (readable) destination right after it is written, while it is still in the page cache, and hashed.
+    Setting `cancel_evt` raises CopyCancelled before the next chunk.
+    """
+    buf, view = _get_read_buffer()
+    back_view = memoryview(_get_compare_buffer()) if dest_hasher is not None else None
+    while True:
+        _check_cancelled(cancel_evt)
+        n = f_src.readinto(buf)
+        if not n:
+            break
+        chunk = view[:n]
+        if hasher is not None:
+            hasher.update(chunk)
+        if f_dest is not None:
+            offset = f_dest.tell() if dest_hasher is not None else 0
+            _write_all(f_dest, chunk)
+            if dest_hasher is not None:
+                dest_hasher.update(back_view[:_read_back(f_dest, back_view[:n], offset)])
+
+def _hash_blocks(filled: queue.SimpleQueue, free: queue.SimpleQueue, errors: list):
+    """Hash thread of _copy_loop_pipelined: feeds each filled block to its hasher, then hands its buffer back."""
+    while (item := filled.get()) is not None:
+        hasher, block = item
+        buf = block.obj
+        try:
+            if not errors:
+                hasher.update(block)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            block.release()
+            free.put(buf) # Always handed back, so the copying thread never blocks on a failed hash
+
+def _copy_loop_pipelined(f_src, f_dest, hasher, dest_hasher=None, cancel_evt=None):
+    """
+    Copies and hashes the rest of `f_src` like _copy_loop, but hashes on a helper thread: both hashing
+    and writing release the GIL, so each block is hashed while it is written and the next one is read.
+    Blocks read back for `dest_hasher` are hashed on the helper thread too.
+    """
+    if not hasattr(_thread_buffers, "pipeline_bufs"):
+        _thread_buffers.pipeline_bufs = [bytearray(READ_BUFFER_SIZE) for _ in range(PIPELINE_DEPTH)]
+    filled, free, errors = queue.SimpleQueue(), queue.SimpleQueue(), []
+    for buf in _thread_buffers.pipeline_bufs:
+        free.put(buf)
+    hash_thread = threading.Thread(target=_hash_blocks, args=(filled, free, errors), daemon=True)
+    hash_thread.start()
+    try:
+        while True:
+            buf = free.get()
+            if cancel_evt is not None and cancel_evt.is_set():
+                free.put(buf)
+                raise CopyCancelled()
+            n = f_src.readinto(buf)
+            if not n:
+                break
+            filled.put((hasher, memoryview(buf)[:n]))
+            offset = f_dest.tell()
+            with memoryview(buf) as view:
+                _write_all(f_dest, view[:n])
+            if dest_hasher is not None:
+                back = memoryview(free.get())
+                filled.put((dest_hasher, back[:_read_back(f_dest, back[:n], offset)]))
+                back.release()
+    finally:
+        filled.put(None)
+        hash_thread.join()
+    if errors:
+        raise errors[0]
+
+def _preallocate(fd: int, size: int) -> bool:
+    """
+    Reserves `size` bytes for a file about to be written in user space, so the filesystem allocates
+    contiguous extents once instead of on every write. Returns True if the file was extended; filesystems
+    that can't allocate natively (fallocate fails, e.g. with EOPNOTSUPP) are simply written without it.
+    """
+    if _fallocate is not None:
+        return _fallocate(fd, 0, 0, size) == 0 # Mode 0: allocate and extend the file size
+    try:
+        if hasattr(os, "posix_fallocate") and not sys.platform.startswith("linux"): # Native elsewhere, e.g. FreeBSD
+            os.posix_fallocate(fd, 0, size)
+            return True
+        if os.name == "nt":
+            os.ftruncate(fd, size) # SetEndOfFile, which allocates the clusters on NTFS
+            return True
+    except OSError:
+        pass
+    return False
+
+def _copy_loop_preallocated(f_src, f_dest, size: int, hasher=None, dest_hasher=None, cancel_evt=None):
+    """
+    Runs _copy_loop into a preallocated destination, trimming it if the source turned out shorter.
+    Large files that are also hashed go through _copy_loop_pipelined instead.
+    """
+    preallocated = size >= SMALL_FILE_SIZE and _preallocate(f_dest.fileno(), size)
+    if hasher is not None and PIPELINE_HASHING and size >= PIPELINED_HASH_SIZE:
+        _copy_loop_pipelined(f_src, f_dest, hasher, dest_hasher, cancel_evt)
+    else:
+        _copy_loop(f_src, f_dest, hasher, dest_hasher, cancel_evt)
+    if preallocated:
+        os.ftruncate(f_dest.fileno(), f_dest.tell())
+
+def _try_ficlone(fd_in: int, fd_out: int, src_dev: int) -> bool:
+    """Linux: makes the destination share the source's extents (reflink). Returns False if not possible."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    devices = (src_dev, os.fstat(fd_out).st_dev)
+    if devices in _no_reflink_devices:
+        return False
+    try:
+        fcntl.ioctl(fd_out, FICLONE, fd_in)
+        return True
+    except OSError:
+        _no_reflink_devices.add(devices) # Different filesystems, or one without copy-on-write support
+        return False
+
+def _try_clonefile(src_file: str, dest_file: str, src_dev: int) -> bool:
+    """macOS: clones the source with clonefile(2), which needs the destination to be absent. Returns False if not possible."""
+    if _clonefile is None:
+        return False
+    try:
+        devices = (src_dev, os.stat(os.path.dirname(os.path.abspath(dest_file))).st_dev)
+    except OSError:
+        return False
+    if devices in _no_reflink_devices:
+        return False
+    try:
+        os.unlink(dest_file)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    if _clonefile(os.fsencode(src_file), os.fsencode(dest_file), 0) == 0:
+        return True
+    if ctypes.get_errno() in (errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV):
+        _no_reflink_devices.add(devices) # Only a filesystem that can't clone rules out later attempts
+    return False
+
+def _fast_copy(src_file: str, dest_file: str, cancel_evt: threading.Event | None = None):
+    """
+    Copies a file's contents and metadata (like shutil.copy2), choosing the method by size:
+    small files take a plain read/write; larger ones try a copy-on-write clone first, then let the
+    kernel move the bytes (copy_file_range for large files, sendfile), finishing with a readinto loop.
+    """
+    with _open_sequential(src_file) as f_src:
+        fd_in = f_src.fileno()
+        src_stat = os.fstat(fd_in)
+        size = src_stat.st_size
+        cloned = size >= SMALL_FILE_SIZE and _try_clonefile(src_file, dest_file, src_stat.st_dev)
+        if not cloned:
+            with open(dest_file, "wb", buffering=0) as f_dest:
+                fd_out = f_dest.fileno()
+                if size < SMALL_FILE_SIZE or not _try_ficlone(fd_in, fd_out, src_stat.st_dev):
+                    # Both kernel paths advance the shared file offsets, so any method can pick up where the last one stopped.
+                    if size >= LARGE_FILE_SIZE and hasattr(os, "copy_file_range"):
+                        _copy_with_copy_file_range(fd_in, fd_out, size - f_src.tell(), cancel_evt)
+                    if size >= SMALL_FILE_SIZE and hasattr(os, "sendfile"):
+                        _copy_with_sendfile(fd_in, fd_out, size - f_src.tell(), cancel_evt)
+                    # Finish in user space: covers small files, platforms without kernel copy and files that grew or report size 0.
+                    if f_src.tell() == 0:
+                        _copy_loop_preallocated(f_src, f_dest, size, cancel_evt=cancel_evt)
+                    else:
+                        _copy_loop(f_src, f_dest, cancel_evt=cancel_evt)
+                    _fadvise(fd_out, "POSIX_FADV_DONTNEED")
+    shutil.copystat(src_file, dest_file)
+
+def copy_and_hash(src_file: str, dest_file: str, algo: str = DEFAULT_DIGEST, verify: bool = False,
+                  cancel_evt: threading.Event | None = None) -> str:
+    """
+    Copies a file's contents and metadata while hashing the bytes as they pass through,
+    so the source is read only once. Returns the hex digest of the copied data.
+    When the file can be cloned copy-on-write instead, the source is only read to hash it.
+    With `verify`, every written block is read back and hashed as the copy goes, the data is
+    flushed to disk so write-back errors surface here, and an IOError is raised if the digests differ.
+    """
+    hasher = _new_hasher(algo)
+    dest_hasher = None
+    with _open_sequential(src_file) as f_src:
+        src_stat = os.fstat(f_src.fileno())
+        clone_worthwhile = src_stat.st_size >= SMALL_FILE_SIZE
+        if clone_worthwhile and _try_clonefile(src_file, dest_file, src_stat.st_dev):
+            _copy_loop(f_src, None, hasher, cancel_evt=cancel_evt)
+        else:
+            with open(dest_file, "w+b" if verify else "wb", buffering=0) as f_dest:
+                if clone_worthwhile and _try_ficlone(f_src.fileno(), f_dest.fileno(), src_stat.st_dev):
+                    _copy_loop(f_src, None, hasher, cancel_evt=cancel_evt)
+                else:
+                    dest_hasher = _new_hasher(algo) if verify else None
+                    _copy_loop_preallocated(f_src, f_dest, src_stat.st_size, hasher, dest_hasher, cancel_evt)
+                    if verify:
+                        os.fsync(f_dest.fileno())
+                    _fadvise(f_dest.fileno(), "POSIX_FADV_DONTNEED")
+    shutil.copystat(src_file, dest_file)
+    digest = hasher.hexdigest()
+    if verify:
+        # Clones share the source's data blocks, so there is nothing written to read back; hash the result instead
+        dest_digest = dest_hasher.hexdigest() if dest_hasher is not None else get_digest(dest_file, algo)
+        if dest_digest != digest:
+            raise IOError(f"Checksum mismatch after copying to {dest_file}")
+    return digest
+
+def _report_scan_error(e: OSError):
+    """Reports a directory that could not be read during a scan."""
+    tqdm.write(f"{Fore.RED}Error scanning {e.filename}: {e}")
+
+def _is_rotational(path: str) -> bool:
+    """
+    Linux only: reports whether `path` is on a spinning disk, from the rotational flag in sysfs of its
+    block device (or, for a partition, of the disk holding it). Other platforms and virtual devices return False.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return False
+    device_dir = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    for queue_dir in (f"{device_dir}/queue", f"{device_dir}/../queue"):
+        try:
+            with open(f"{queue_dir}/rotational", "r", encoding="ascii") as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+def _scan_with_fwalk(source: str, destination: str, by_inode: bool = False, onerror=_report_scan_error):
+    """
+    POSIX scan: stats each file relative to its open directory fd, avoiding full path resolution.
+    With `by_inode`, each directory's files come out in inode order.
+    """
+    for dirpath, _, filenames, dir_fd in os.fwalk(source, onerror=onerror):
+        relative_dir = os.path.relpath(dirpath, source)
+        dest_dir = destination if relative_dir == os.curdir else os.path.join(destination, relative_dir)
+        # Joined once per directory, so each file's paths are plain concatenations
+        src_prefix, dest_prefix = os.path.join(dirpath, ""), os.path.join(dest_dir, "")
+        files, inodes = [], []
+        for filename in filenames:
+            try:
+                st = os.stat(filename, dir_fd=dir_fd)
+            except OSError:
+                continue # Broken symlink or vanished file
+            if stat.S_ISREG(st.st_mode):
+                files.append(FileEntry(f"{src_prefix}{filename}", f"{dest_prefix}{filename}",
+                                       st.st_size, st.st_mtime_ns))
+                inodes.append(st.st_ino)
+        if by_inode:
+            files = [entry for _, entry in sorted(zip(inodes, files), key=lambda pair: pair[0])]
+        yield dest_dir, files
+
+def _scan_with_scandir(source: str, destination: str, by_inode: bool = False, onerror=_report_scan_error):
+    """
+    Portable scan (used on Windows, where DirEntry.stat() reuses the data returned by the directory listing).
+    With `by_inode`, each directory's files come out in inode order.
+    """
+    pending_dirs = [(source, destination)]
+    while pending_dirs:
+        src_dir, dest_dir = pending_dirs.pop()
+        dest_prefix = os.path.join(dest_dir, "")
+        files, inodes = [], []
+        try:
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    dest_file = f"{dest_prefix}{entry.name}"
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are listed but not descended into.
+                        if not entry.is_symlink():
+                            pending_dirs.append((entry.path, dest_file))
+                    elif entry.is_file():
+                        st = entry.stat()
+                        files.append(FileEntry(entry.path, dest_file, st.st_size, st.st_mtime_ns))
+                        if by_inode:
+                            inodes.append(entry.inode())
+        except OSError as e:
+            onerror(e)
+        if by_inode:
+            files = [entry for _, entry in sorted(zip(inodes, files), key=lambda pair: pair[0])]
+        yield dest_dir, files
+
+def iter_tree(source: str, destination: str, onerror=_report_scan_error):
+    """
+    Walks the source lazily, yielding each destination directory to create together with the
+    FileEntry records of the files directly inside it. A file source yields a single entry and no
+    directory (an empty string). On spinning disks each directory's files are listed in inode order,
+    which roughly follows their placement on disk and so cuts seeking between files.
+    Directories that can't be read are passed to `onerror` and skipped.
+    """
+    if os.path.isfile(source):
+        st = os.stat(source)
+        yield "", [FileEntry(source, destination, st.st_size, st.st_mtime_ns)]
+        return
+    scanner = _scan_with_fwalk if hasattr(os, "fwalk") else _scan_with_scandir
+    yield from scanner(source, destination, by_inode=_is_rotational(source), onerror=onerror)
+
+def scan_tree(source: str, destination: str) -> tuple[list[FileEntry], list[str]]:
+    """
+    Walks the source once, returning every file with its destination path, size and mtime,
+    plus the destination directories to create. A file source yields a single entry.
+    """
+    entries, dest_dirs = [], []
+    for dest_dir, files in iter_tree(source, destination):
+        if dest_dir:
+            dest_dirs.append(dest_dir)
+        entries.extend(files)
+    return entries, dest_dirs
+
+def _dir_is_empty(path: str) -> bool:
+    """Reports whether a directory has no entries at all, reading only the first one."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except OSError:
+        return False
+
+def get_total_size(entries: list[FileEntry]) -> int:
+    """Calculates the total size of the files found by scan_tree."""
+    return sum(entry.size for entry in entries)
+
+def _ensure_dir(path: str):
+    """Creates a destination directory (and its parents) unless it is already known to exist."""
+    if path and path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+def _copy_file_with_retry(src_file: str, dest_file: str, retries: int, state_q: queue.SimpleQueue,
+                          cancel_evt: threading.Event, hash_contents: bool = False, verify: bool = False) -> str | None:
+    """
+    Helper function to handle the copy and retry logic for a single file.
+    With `hash_contents`, the file is hashed while it is copied and the digest is returned;
+    `verify` additionally checks the destination's digest and retries if it differs.
+    A copy cancelled by the user stops within one chunk and its partial destination is removed.
+    """
     for attempt in range(retries + 1):
         try:
-            parent_dir = os.path.dirname(dest_file)
-            if parent_dir:
-                os.makedirs(parent_dir, exist_ok=True)
-            shutil.copy2(src_file, dest_file)
-            status_message = "" # Clear status on success
-            return 
+            _ensure_dir(os.path.dirname(dest_file))
+            digest = None
+            if not hash_contents:
+                _fast_copy(src_file, dest_file, cancel_evt)
+            else:
+                digest = copy_and_hash(src_file, dest_file, verify=verify, cancel_evt=cancel_evt)
+            if attempt > 0:
+                state_q.put(ProgressState(status="")) # Clear the retry message on success
+            return digest
+        except CopyCancelled:
+            try:
+                os.remove(dest_file) # A half-written file could pass a later size check once preallocated
+            except OSError:
+                pass
+            raise
         except Exception as e:
-            if attempt < retries:
+            _created_dirs.discard(os.path.dirname(dest_file)) # Recreate it on retry in case it was removed
+            filename = os.path.basename(src_file) # Only needed for the messages, so not computed per file
+            if attempt < retries and not cancel_evt.is_set():
                 retry_delay = 3
                 error_str = str(e).replace('\n', ' ').replace('\r', '')
-                status_message = (f"{Fore.YELLOW}Error on '{currently_processed_file}': {error_str}. "
-                                  f"Retrying... (Attempt {attempt + 1}/{retries}){Style.RESET_ALL}")
-                time.sleep(retry_delay)
+                state_q.put(ProgressState(status=(f"{Fore.YELLOW}Error on '{filename}': {error_str}. "
+                                                  f"Retrying... (Attempt {attempt + 1}/{retries}){Style.RESET_ALL}")))
+                cancel_evt.wait(retry_delay)
             else:
-                status_message = "" # Clear status on final failure
-                copy_error = (e, currently_processed_file)
+                state_q.put(ProgressState(error=(e, filename), status="")) # Clear status on final failure
                 raise
-    status_message = ""
+    return None
 
-def checksum_copy_worker(source: str, destination: str, retries: int, pbar: tqdm):
+def _copy_entry(entry: FileEntry, retries: int, state_q: queue.SimpleQueue,
+                cancel_evt: threading.Event, verify: bool = False, check_existing: bool = True,
+                quick_check: bool = True):
     """
-    Copies files and folders, performing checksum verification and retries (Full Sync).
+    Copies a single file and reports its progress. With `check_existing`, the copy is skipped when
+    the destination already holds identical content, and the digest of a copied file is cached.
+    `quick_check` lets a matching size and modification time stand in for a content comparison.
+    `verify` applies either way; without `check_existing` the digest is only used for the check.
     """
-    global copy_error, currently_processed_file
+    if cancel_evt.is_set():
+        return
+    state_q.put(ProgressState(current_file=os.path.basename(entry.src)))
+    if not check_existing:
+        _copy_file_with_retry(entry.src, entry.dst, retries, state_q, cancel_evt, hash_contents=verify, verify=verify)
+    elif not _files_equal(entry, quick_check):
+        digest = _copy_file_with_retry(entry.src, entry.dst, retries, state_q, cancel_evt, hash_contents=True, verify=verify)
+        _record_copied_file(entry.src, entry.dst, digest)
+    state_q.put(ProgressState(bytes_done=entry.size))
+
+def _run_file_tasks(task, entries, jobs: int, retries: int, state_q: queue.SimpleQueue,
+                    cancel_evt: threading.Event):
+    """
+    Runs `task` for every FileEntry of a list or a live scan on a bounded thread pool.
+    The first failure cancels all files that have not started yet and is re-raised.
+    """
+    def stop_on_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            cancel_evt.set()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = []
+        for entry in entries:
+            if cancel_evt.is_set():
+                break # A file failed or the user cancelled, so stop taking work from the scan
+            future = executor.submit(task, entry, retries, state_q, cancel_evt)
+            future.add_done_callback(stop_on_failure)
+            futures.append(future)
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                cancel_evt.set()
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+
+def copy_tree(entries, dest_dirs: list[str], retries: int, state_q: queue.SimpleQueue,
+              cancel_evt: threading.Event, jobs: int = DEFAULT_JOBS, verify: bool = False, check_existing: bool = True,
+              quick_check: bool = True):
+    """
+    Copies a list (or an iterator) of FileEntry records with retries, running in its own thread.
+    Full Sync passes `check_existing` to skip files whose destination already matches (with checksum
+    caching); the missing-files mode turns it off, since every entry is known to be absent.
+    """
+    if check_existing:
+        load_checksum_cache()
+    _created_dirs.clear() # Directories seen by an earlier run may since have been removed
     try:
-        if os.path.isfile(source):
-            currently_processed_file = os.path.basename(source)
-            if not (os.path.exists(destination) and get_checksum(source) == get_checksum(destination)):
-                _copy_file_with_retry(source, destination, retries)
-            pbar.update(os.path.getsize(source))
+        for dest_dir in dest_dirs:
+            _ensure_dir(dest_dir)
+        if isinstance(entries, list) and len(entries) == 1:
+            _copy_entry(entries[0], retries, state_q, cancel_evt, verify, check_existing, quick_check)
             return
-
-        for dirpath, _, filenames in os.walk(source):
-            relative_dir = os.path.relpath(dirpath, source)
-            dest_dir = os.path.join(destination, relative_dir)
-            os.makedirs(dest_dir, exist_ok=True)
-            for filename in filenames:
-                currently_processed_file = filename
-                src_file = os.path.join(dirpath, filename)
-                dest_file = os.path.join(dest_dir, filename)
-                if not (os.path.exists(dest_file) and get_checksum(src_file) == get_checksum(dest_file)):
-                    _copy_file_with_retry(src_file, dest_file, retries)
-                pbar.update(os.path.getsize(src_file))
+        _run_file_tasks(partial(_copy_entry, verify=verify, check_existing=check_existing, quick_check=quick_check),
+                        entries, jobs, retries, state_q, cancel_evt)
     except Exception:
         return
     finally:
-        currently_processed_file = "Finalizing..."
+        state_q.put(ProgressState(current_file="Finalizing..."))
+        if check_existing:
+            save_checksum_cache()
 
-def missing_files_copy_worker(files_to_copy: list, retries: int, pbar: tqdm):
+def sync_tree(source: str, destination: str, retries: int, state_q: queue.SimpleQueue,
+              cancel_evt: threading.Event, jobs: int = DEFAULT_JOBS, verify: bool = False, quick_check: bool = True):
     """
-    Copies a pre-determined list of missing files.
+    Full Sync without a separate sizing pass, running in its own thread: copy_tree's pool starts on
+    the first files while the rest of the source is still being scanned. Each directory's bytes are
+    reported as it is listed, so the progress bar's total grows with the scan. Scan errors are reported
+    through the queue as well, since printing from this thread would tear the monitor's frame.
     """
-    global copy_error, currently_processed_file
-    try:
-        for src_file, dest_file in files_to_copy:
-            currently_processed_file = os.path.basename(src_file)
-            _copy_file_with_retry(src_file, dest_file, retries)
-            pbar.update(os.path.getsize(src_file))
-    except Exception:
+    if os.path.isfile(source):
+        entries, _ = scan_tree(source, destination)
+        state_q.put(ProgressState(bytes_found=entries[0].size, files_found=1))
+        copy_tree(entries, [], retries, state_q, cancel_evt, jobs, verify, quick_check=quick_check)
         return
+
+    def report_scan_error(e: OSError):
+        state_q.put(ProgressState(status=f"{Fore.RED}Error scanning {e.filename}: {e}{Style.RESET_ALL}"))
+
+    def discovered_entries():
+        for dest_dir, files in iter_tree(source, destination, onerror=report_scan_error):
+            _ensure_dir(dest_dir)
+            if files:
+                state_q.put(ProgressState(bytes_found=sum(entry.size for entry in files), files_found=len(files)))
+                yield from files
+
+    copy_tree(discovered_entries(), [], retries, state_q, cancel_evt, jobs, verify, quick_check=quick_check)
+
+def robocopy_tree(source: str, destination: str, retries: int, state_q: queue.SimpleQueue,
+                  cancel_evt: threading.Event, jobs: int = DEFAULT_JOBS):
+    """
+    Windows only: hands a whole folder to robocopy's multithreaded copier, running in its own thread.
+    Robocopy skips files whose size and timestamp match by itself; each file it copies is reported
+    from its output as it finishes, and the bytes of skipped files are settled when the bar completes.
+    """
+    command = ["robocopy", source, destination, "/E", f"/MT:{max(1, min(jobs, 128))}", f"/R:{retries}", "/W:3",
+               "/BYTES", "/NDL", "/NJH", "/NJS", "/NP"]
+    last_error = ""
+    try:
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, encoding="oem", errors="replace") as proc:
+            for line in proc.stdout:
+                if cancel_evt.is_set():
+                    proc.terminate()
+                    return
+                fields = [field.strip() for field in line.rstrip("\r\n").split("\t") if field.strip()]
+                # File lines are "<class>\t<size>\t<path>"; anything else (mostly error reports) is kept for the message
+                if len(fields) >= 3 and fields[-2].isdigit():
+                    if fields[-3].lower() in ROBOCOPY_COPIED_CLASSES:
+                        state_q.put(ProgressState(current_file=os.path.basename(fields[-1]), bytes_done=int(fields[-2])))
+                elif fields:
+                    last_error = " ".join(fields)
+        # Exit codes below 8 mean success (files copied, skipped or extra); 8 and up mean some copies failed
+        if proc.returncode >= 8:
+            raise OSError(f"robocopy exited with code {proc.returncode}: {last_error}")
+    except Exception as e:
+        state_q.put(ProgressState(error=(e, os.path.basename(source)), status=""))
     finally:
-        currently_processed_file = "Finalizing..."
+        state_q.put(ProgressState(current_file="Finalizing..."))
 
-def find_missing_files(source_path: str, dest_path: str) -> tuple[list, int]:
+def _iter_relative_files(root: str):
+    """Yields the path of every file under `root`, relative to `root`, using an iterative os.scandir walk."""
+    pending_dirs = [("", root)]
+    while pending_dirs:
+        rel_dir, abs_dir = pending_dirs.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    rel_path = f"{rel_dir}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append((f"{rel_path}{os.sep}", entry.path))
+                    else:
+                        yield rel_path
+        except OSError as e:
+            _report_scan_error(e)
+
+def find_missing_files(source_path: str, dest_path: str) -> tuple[list[FileEntry], int]:
     """
-    Scans for source files whose filenames do not exist anywhere in the destination path.
+    Scans for source files that do not exist at their corresponding path in the destination.
     """
     files_to_copy = []
     total_size = 0
-    
-    # --- FIX: Pre-scan destination to get all existing filenames ---
-    dest_filenames = set()
-    search_dir = ""
-    
-    if os.path.isdir(source_path):
-        # If source is a directory, the search area is the destination directory
-        search_dir = dest_path
-    else:
-        # If source is a file, the search area is the parent of the destination file path
-        search_dir = os.path.dirname(dest_path)
+    entries, _ = scan_tree(source_path, dest_path)
 
-    if os.path.isdir(search_dir):
-        for _, _, filenames in os.walk(search_dir):
-            for filename in filenames:
-                dest_filenames.add(filename)
+    if not os.path.isdir(source_path):
+        # A single file only needs its one destination path checked
+        if entries and not os.path.exists(dest_path):
+            files_to_copy.append(entries[0])
+            total_size += entries[0].size
+        return files_to_copy, total_size
 
-    # --- Now, check source against the collected destination filenames ---
-    if os.path.isdir(source_path):
-        for dirpath, _, filenames in os.walk(source_path):
-            for filename in filenames:
-                # Check if the filename itself is missing from the destination tree
-                if filename not in dest_filenames:
-                    src_file = os.path.join(dirpath, filename)
-                    relative_path = os.path.relpath(src_file, source_path)
-                    dst_file = os.path.join(dest_path, relative_path)
-                    
-                    files_to_copy.append((src_file, dst_file))
-                    total_size += os.path.getsize(src_file)
-    else: # It's a single file
-        source_filename = os.path.basename(source_path)
-        if source_filename not in dest_filenames:
-            files_to_copy.append((source_path, dest_path))
-            total_size += os.path.getsize(source_path)
+    # --- Pre-scan destination to get the relative path of every existing file ---
+    dest_files = frozenset(_iter_relative_files(dest_path)) if os.path.isdir(dest_path) else frozenset()
+
+    # --- Now, check source against the collected destination paths ---
+    # Every scanned destination path starts with the destination folder, so slicing replaces os.path.relpath
+    prefix_len = len(os.path.join(dest_path, ""))
+    relative_dests = (entry.dst[prefix_len:] for entry in entries)
+    for entry, relative_dest in zip(entries, relative_dests):
+        if relative_dest not in dest_files:
+            files_to_copy.append(entry)
+            total_size += entry.size
 
     return files_to_copy, total_size
 
@@ -174,61 +961,156 @@ def format_duration(seconds: float) -> str:
     hours, minutes = divmod(minutes, 60)
     return f"{hours} hour(s), {minutes} minute(s), and {secs} second(s)"
 
-def run_transfer_monitoring(copy_thread: threading.Thread, pbar: tqdm, ui_frame_printer, mode_str: str):
-    """Monitors a running copy thread, displaying stats and handling UI redraws."""
+def _drain_progress(state_q: queue.SimpleQueue, progress: ProgressState):
+    """Folds every report waiting in the queue into the monitor's running ProgressState."""
+    while True:
+        try:
+            update = state_q.get_nowait()
+        except queue.Empty:
+            return
+        progress.bytes_done += update.bytes_done
+        progress.bytes_found += update.bytes_found
+        progress.files_found += update.files_found
+        if update.current_file is not None:
+            progress.current_file = update.current_file
+        if update.status is not None:
+            progress.status = update.status
+        if update.error is not None and progress.error is None:
+            progress.error = update.error
+
+class StatsSample(NamedTuple):
+    """One reading of the system statistics; the network speeds are None when not tracked."""
+    cpu_percent: float
+    ram_percent: float
+    upload_speed: float | None
+    download_speed: float | None
+
+class Stats:
+    """Samples the system statistics shown under the progress bar, keeping the state needed between samples."""
+
+    def __init__(self, track_network: bool = True):
+        self.track_network = track_network
+        psutil.cpu_percent(interval=None) # Prime the counter so the first sample covers a real interval
+        self._last_net_io = psutil.net_io_counters() if track_network else None
+        self._last_time = time.monotonic()
+
+    def sample(self) -> StatsSample:
+        """Reads CPU and RAM usage, plus network speeds since the previous sample when tracked."""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        ram_percent = psutil.virtual_memory().percent
+        if not self.track_network:
+            return StatsSample(cpu_percent, ram_percent, None, None)
+
+        current_net_io = psutil.net_io_counters()
+        current_time = time.monotonic()
+        elapsed_time = current_time - self._last_time
+        upload_speed, download_speed = 0, 0
+        if elapsed_time > 0:
+            upload_speed = (current_net_io.bytes_sent - self._last_net_io.bytes_sent) / elapsed_time
+            download_speed = (current_net_io.bytes_recv - self._last_net_io.bytes_recv) / elapsed_time
+        self._last_net_io, self._last_time = current_net_io, current_time
+        return StatsSample(cpu_percent, ram_percent, upload_speed, download_speed)
+
+def format_stats_line(sample: StatsSample, file_label: str) -> str:
+    """Formats a stats sample and the current file name as the colored line under the progress bar."""
+    if sample.upload_speed is None:
+        return STATS_TEMPLATE_NO_NET.format(sample.cpu_percent, sample.ram_percent, file_label)
+    return STATS_TEMPLATE.format(sample.cpu_percent, sample.ram_percent, format_speed(sample.upload_speed),
+                                 format_speed(sample.download_speed), file_label)
+
+def run_transfer_monitoring(copy_thread: threading.Thread, pbar: tqdm, state_q: queue.SimpleQueue,
+                            cancel_evt: threading.Event, stats: Stats, ui_frame_printer,
+                            mode_str: str) -> tuple[float, tuple | None, int]:
+    """
+    Monitors a running copy thread, displaying stats and handling UI redraws.
+    Returns the elapsed time, the first (exception, filename) error reported, if any, and the
+    number of files a scan running alongside the copy reported finding.
+    """
+    progress = ProgressState(current_file="Initializing...", status="")
     start_time = time.time()
     copy_thread.daemon = True
     copy_thread.start()
     
-    last_net_io = psutil.net_io_counters()
-    last_check_time = time.time()
+    # On POSIX a SIGWINCH handler flags resizes, so the terminal size isn't polled every tick
+    term_resized = threading.Event()
+    watch_sigwinch = hasattr(signal, "SIGWINCH")
+    if watch_sigwinch:
+        previous_winch_handler = signal.signal(signal.SIGWINCH, lambda *_: term_resized.set())
     last_term_size = shutil.get_terminal_size()
+    # On POSIX terminals each frame is encoded once and handed to the tty in a single os.write,
+    # bypassing the text layer; elsewhere it goes through Colorama's stdout wrapper
+    ui_fd = _raw_stdout.fileno() if os.name != "nt" and _raw_stdout.isatty() else None
+    ui_encoding = _raw_stdout.encoding or "utf-8"
+    _raw_stdout.flush() # Anything still buffered must reach the terminal before the raw frames
+
+    # psutil is sampled on its own slower cadence, and a tick only redraws when something visible changed
+    stats_sample = stats.sample()
+    next_sample_time = time.monotonic() + STATS_SAMPLE_INTERVAL
+    redraw_step = max(1, int(pbar.total * REDRAW_PROGRESS_STEP))
+    drawn_bytes, drawn_status, redraw = 0, None, True
     
     try:
         while copy_thread.is_alive():
-            current_term_size = shutil.get_terminal_size()
-            if current_term_size != last_term_size:
-                ui_frame_printer(mode_str)
-                last_term_size = current_term_size
+            if watch_sigwinch:
+                if term_resized.is_set():
+                    term_resized.clear()
+                    ui_frame_printer(mode_str)
+                    redraw = True
+            else:
+                current_term_size = shutil.get_terminal_size()
+                if current_term_size != last_term_size:
+                    ui_frame_printer(mode_str)
+                    last_term_size = current_term_size
+                    redraw = True
 
-            cpu_percent = psutil.cpu_percent()
-            ram_percent = psutil.virtual_memory().percent
-            
-            current_net_io = psutil.net_io_counters()
-            current_time = time.time()
-            elapsed_time = current_time - last_check_time
-            
-            upload_speed, download_speed = 0, 0
-            if elapsed_time > 0:
-                upload_speed = (current_net_io.bytes_sent - last_net_io.bytes_sent) / elapsed_time
-                download_speed = (current_net_io.bytes_recv - last_net_io.bytes_recv) / elapsed_time
-            last_net_io, last_check_time = current_net_io, current_time
-            
-            file_info = f"File: {currently_processed_file[:30]:<30}"
-            stats_line = (f"{Fore.CYAN}CPU: {cpu_percent:>5.1f}%{Style.RESET_ALL} | "
-                          f"{Fore.MAGENTA}RAM: {ram_percent:>5.1f}%{Style.RESET_ALL} | "
-                          f"{Fore.GREEN}Up: {format_speed(upload_speed)}{Style.RESET_ALL} | "
-                          f"{Fore.YELLOW}Down: {format_speed(download_speed)}{Style.RESET_ALL} | "
-                          f"{Style.DIM}{file_info}{Style.RESET_ALL}")
-            
-            sys.stdout.write(f'\r{pbar}\n\x1b[2K{stats_line}\n\x1b[2K{status_message}\r')
-            sys.stdout.flush()
-            sys.stdout.write('\x1b[2A')
+            _drain_progress(state_q, progress)
+            if progress.bytes_found > pbar.total: # A scan running alongside the copy found more files
+                pbar.total = progress.bytes_found
+                redraw_step = max(1, int(pbar.total * REDRAW_PROGRESS_STEP))
+                redraw = True
+            now = time.monotonic()
+            if now >= next_sample_time:
+                stats_sample = stats.sample()
+                next_sample_time = now + STATS_SAMPLE_INTERVAL
+                redraw = True
+
+            if redraw or progress.bytes_done - drawn_bytes >= redraw_step or progress.status != drawn_status:
+                stats_line = format_stats_line(stats_sample, progress.current_file)
+                # Progress is pulled from the workers' reports once per tick rather than pushed per file
+                if progress.bytes_done > pbar.n: pbar.update(progress.bytes_done - pbar.n)
+                # The whole frame, including the cursor-up that re-anchors the next one, goes out in one write
+                frame = f'\r{pbar}\n\x1b[2K{stats_line}\n\x1b[2K{progress.status}\r\x1b[2A'
+                if ui_fd is not None:
+                    data = frame.encode(ui_encoding, "replace")
+                    while data:
+                        data = data[os.write(ui_fd, data):]
+                else:
+                    sys.stdout.write(frame)
+                    sys.stdout.flush()
+                drawn_bytes, drawn_status, redraw = progress.bytes_done, progress.status, False
             
-            time.sleep(1)
+            # Returns as soon as the copy finishes instead of sleeping out the whole interval
+            copy_thread.join(timeout=UI_REFRESH_INTERVAL)
     except KeyboardInterrupt:
+        cancel_evt.set()
         print("\n\n\n")
         print(f"{Fore.YELLOW}{Style.BRIGHT}✖ Operation cancelled by user.{Style.RESET_ALL}")
         sys.stdout.write('\x1b[?25h'); sys.stdout.flush()
         sys.exit(0)
+    finally:
+        if watch_sigwinch:
+            signal.signal(signal.SIGWINCH, previous_winch_handler)
 
     end_time = time.time()
     
+    # Reports sent after the last tick (all of them, for a copy faster than one tick) must reach the total before it is filled
+    copy_thread.join()
+    _drain_progress(state_q, progress)
+    pbar.total = max(pbar.total, progress.bytes_found)
     if pbar.n < pbar.total: pbar.update(pbar.total - pbar.n)
     pbar.close()
-    copy_thread.join()
     
-    return end_time - start_time
+    return end_time - start_time, progress.error, progress.files_found
 
 def main():
     """Main function to orchestrate the copy process."""
@@ -246,6 +1128,20 @@ def main():
     parser.add_argument("source", help="The source file or folder path.")
     parser.add_argument("destination", help="The destination folder path.")
     parser.add_argument("--retry", type=int, default=0, help="Number of times to retry a failed file copy.\nDefault is 0 (one attempt, no retries).")
+    parser.add_argument("--jobs", "--workers", type=int, default=None,
+                        help=f"Number of files to verify and copy in parallel.\nDefault is {DEFAULT_JOBS}, or 1 when the source is on a spinning disk.")
+    parser.add_argument("--verify", action="store_true",
+                        help="Read each block back right after it is written (from the page cache) and fsync\n"
+                             "the file, then compare its checksum with the source.\n"
+                             "Applies to Full Sync and to '--list-missing copy-all'.")
+    parser.add_argument("--checksum", action="store_true",
+                        help="Compare file contents even when size and modification time already match.")
+    parser.add_argument("--robocopy", action="store_true",
+                        help="Windows only: let robocopy copy a folder with --jobs threads.\n"
+                             "Bypasses the checksum cache, --verify and --checksum (robocopy skips files\n"
+                             "whose size and timestamp match).")
+    parser.add_argument("--no-net-stats", action="store_true",
+                        help="Hide the network upload/download speeds (skips polling the network counters).")
     parser.add_argument("--list-missing", nargs='?', const='display', default=None,
                         help="Displays missing files. Use '--list-missing copy-all' to copy just the missing files.")
     
@@ -257,6 +1153,9 @@ def main():
     
     source_path = args.source
     dest_path = args.destination
+    state_q = queue.SimpleQueue() # Progress reports from the copy threads to the monitor
+    cancel_evt = threading.Event() # Set to stop the copy threads early
+    stats = Stats(track_network=not args.no_net_stats)
 
     def print_ui_frame(mode_str=""):
         clear_screen()
@@ -269,6 +1168,10 @@ def main():
 
     if not os.path.exists(source_path): print(f"{Fore.RED}Error: Source path does not exist: {source_path}"); return
 
+    if args.jobs is None:
+        # Parallel workers reading a spinning disk would seek between files, undoing the inode-ordered scan
+        args.jobs = 1 if _is_rotational(source_path) else DEFAULT_JOBS
+
     if os.path.isdir(source_path):
         target_dest_path = dest_path
     else:
@@ -288,11 +1191,11 @@ def main():
             sys.exit(0)
 
         print(f"\n{Fore.YELLOW}Found {len(files_to_copy)} missing file(s) ({tqdm.format_sizeof(total_missing_size, 'B')}):{Style.RESET_ALL}")
-        for src, _ in sorted(files_to_copy):
+        for entry in sorted(files_to_copy):
             if os.path.isdir(source_path):
-                 print(f" - {os.path.relpath(src, source_path)}")
+                 print(f" - {os.path.relpath(entry.src, source_path)}")
             else:
-                 print(f" - {os.path.basename(src)}")
+                 print(f" - {os.path.basename(entry.src)}")
 
 
         if args.list_missing == 'copy-all':
@@ -300,31 +1203,53 @@ def main():
             print_ui_frame("Copying Missing Files...")
             
             pbar = tqdm(total=total_missing_size, unit='B', unit_scale=True, colour='green', bar_format="{l_bar}{bar:50}{r_bar}", leave=True)
-            copy_thread = threading.Thread(target=missing_files_copy_worker, args=(files_to_copy, args.retry, pbar))
-            total_duration = run_transfer_monitoring(copy_thread, pbar, print_ui_frame, "Copying Missing Files...")
+            copy_thread = threading.Thread(target=copy_tree,
+                                           args=(files_to_copy, [], args.retry, state_q, cancel_evt, args.jobs),
+                                           kwargs={"verify": args.verify, "check_existing": False})
+            total_duration, copy_error, _ = run_transfer_monitoring(copy_thread, pbar, state_q, cancel_evt, stats,
+                                                                    print_ui_frame, "Copying Missing Files...")
         else:
             sys.exit(0)
     else:
         # --- Normal Full Sync Operation ---
         print_ui_frame("Preparing for Full Sync...")
+        if args.robocopy and os.name != "nt":
+            print(f"{Fore.YELLOW}Note: --robocopy is Windows only; the built-in copier will be used.{Style.RESET_ALL}")
+        elif args.robocopy and not os.path.isdir(source_path):
+            print(f"{Fore.YELLOW}Note: --robocopy only copies folders; the built-in copier will be used.{Style.RESET_ALL}")
         input("Press Enter to begin the transfer...")
-        print_ui_frame("Calculating Total Size...")
-        total_size = get_total_size(source_path)
+        if args.robocopy and os.name == "nt" and os.path.isdir(source_path):
+            # Robocopy reports only what it copies, so the bar needs the whole total before it starts
+            print_ui_frame("Calculating Total Size...")
+            entries, _ = scan_tree(source_path, target_dest_path)
+            total_size = get_total_size(entries)
 
-        if total_size == 0: print(f"{Fore.YELLOW}Warning: Source is empty. Nothing to copy."); return
-        
-        pbar = tqdm(total=total_size, unit='B', unit_scale=True, colour='green', bar_format="{l_bar}{bar:50}{r_bar}", leave=True)
-        copy_thread = threading.Thread(target=checksum_copy_worker, args=(source_path, target_dest_path, args.retry, pbar))
-        total_duration = run_transfer_monitoring(copy_thread, pbar, print_ui_frame, "Performing Full Sync...")
+            if total_size == 0: print(f"{Fore.YELLOW}Warning: Source is empty. Nothing to copy."); return
+
+            pbar = tqdm(total=total_size, unit='B', unit_scale=True, colour='green', bar_format="{l_bar}{bar:50}{r_bar}", leave=True)
+            copy_thread = threading.Thread(target=robocopy_tree,
+                                           args=(source_path, target_dest_path, args.retry, state_q, cancel_evt, args.jobs))
+        else:
+            # An empty folder is caught up front, before the bar is drawn or the destination is created
+            if os.path.isdir(source_path) and _dir_is_empty(source_path):
+                print(f"{Fore.YELLOW}Warning: Source is empty. Nothing to copy."); return
+            # The source is scanned while it is copied, so the bar's total grows as files are found
+            pbar = tqdm(total=0, unit='B', unit_scale=True, colour='green', bar_format="{l_bar}{bar:50}{r_bar}", leave=True)
+            copy_thread = threading.Thread(target=sync_tree,
+                                           args=(source_path, target_dest_path, args.retry, state_q, cancel_evt, args.jobs),
+                                           kwargs={"verify": args.verify, "quick_check": not args.checksum})
+        total_duration, copy_error, files_found = run_transfer_monitoring(copy_thread, pbar, state_q, cancel_evt, stats,
+                                                                          print_ui_frame, "Performing Full Sync...")
+        if not copy_error and pbar.total == 0 and files_found == 0:
+            print(f"\r\x1b[2K{Fore.YELLOW}Warning: Source is empty. Nothing to copy."); return
 
     # --- FINALIZATION for both modes ---
     formatted_duration = format_duration(total_duration)
 
-    final_stats = (f"{Fore.CYAN}CPU: {psutil.cpu_percent():>5.1f}%{Style.RESET_ALL} | "
-                   f"{Fore.MAGENTA}RAM: {psutil.virtual_memory().percent:>5.1f}%{Style.RESET_ALL} | "
-                   f"{Fore.GREEN}Up: {format_speed(0)}{Style.RESET_ALL} | "
-                   f"{Fore.YELLOW}Down: {format_speed(0)}{Style.RESET_ALL} | "
-                   f"{Style.DIM}File: {'Complete':<30}{Style.RESET_ALL}")
+    final_sample = stats.sample()
+    if final_sample.upload_speed is not None:
+        final_sample = final_sample._replace(upload_speed=0, download_speed=0)
+    final_stats = format_stats_line(final_sample, "Complete")
 
     sys.stdout.write(f'\r\x1b[2K{final_stats}\n\x1b[2K\n')
     sys.stdout.flush()